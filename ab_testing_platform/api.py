@@ -1,7 +1,10 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
+import asyncio
+import functools
 import os
+from concurrent.futures import ProcessPoolExecutor
 import simplejson as json
 import numpy as np
 import pandas as pd
@@ -9,6 +12,33 @@ import pandas as pd
 from ab_testing_platform.pipeline import run_experiment
 from ab_testing_platform.lib.utils import parse_group_buckets
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Experiments are CPU-bound (MCMC / NumPy), so running them on the event
+# loop would block every other request. They are dispatched to a process
+# pool instead; created lazily so merely importing the app (e.g. in the
+# workers runtime) doesn't fork processes.
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor()
+    return _executor
+
 
 async def on_fetch(request, env):
     import asgi
@@ -21,11 +51,21 @@ app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+# index.html never changes during the process lifetime, so it is read
+# once and served from memory instead of hitting the disk (and blocking
+# the event loop) on every request. Set AB_TESTING_RELOAD_STATIC=1 in
+# development to re-read it per request.
+_RELOAD_STATIC = os.environ.get("AB_TESTING_RELOAD_STATIC") == "1"
+_index_html = None
+
+
 @app.get("/", response_class=HTMLResponse)
 async def serve_html():
-    with open(os.path.join("static", "index.html")) as file:
-        html_content = file.read()
-    return HTMLResponse(content=html_content, status_code=200)
+    global _index_html
+    if _index_html is None or _RELOAD_STATIC:
+        with open(os.path.join("static", "index.html"), "rb") as file:
+            _index_html = file.read()
+    return HTMLResponse(content=_index_html, status_code=200)
 
 
 @app.get("/render-image")
@@ -44,21 +84,34 @@ async def run_ab_test_api(
     sequential: bool = Form(False),
     stopping_threshold: float = Form(None)
 ):
-    data = await file.read()
-    try:
-        user_data = json.loads(data)
-    except json.JSONDecodeError:
-        return {"error": "Invalid JSON data"}
+    if ijson is not None:
+        # Parse user records incrementally from the upload spool instead
+        # of buffering the whole payload as one blob before parsing.
+        try:
+            user_data = list(ijson.items(file.file, "item"))
+        except ijson.JSONError:
+            return {"error": "Invalid JSON data"}
+    else:
+        data = await file.read()
+        try:
+            user_data = _json_loads(data)
+        except _JSONDecodeError:
+            return {"error": "Invalid JSON data"}
 
     # TODO: Bring group buckets into the form
     group_buckets = parse_group_buckets("control:0-50,test1:50-100")
     # TODO: Allow the user to specify alpha, prior_successes, and prior_trials
-    test_result = run_experiment(
-        user_data=user_data,
-        group_buckets=group_buckets,
-        method=test_type,
-        sequential=sequential,
-        stopping_threshold=stopping_threshold
+    loop = asyncio.get_running_loop()
+    test_result = await loop.run_in_executor(
+        _get_executor(),
+        functools.partial(
+            run_experiment,
+            user_data=user_data,
+            group_buckets=group_buckets,
+            method=test_type,
+            sequential=sequential,
+            stopping_threshold=stopping_threshold,
+        ),
     )
 
     def convert_to_serializable(obj):
@@ -4,10 +4,29 @@ import numpy as np
 from .utils import calculate_uplift
 from .results import display_results
 
+try:
+    import numpyro  # noqa: F401
+
+    DEFAULT_NUTS_SAMPLER = "numpyro"
+except ImportError:
+    DEFAULT_NUTS_SAMPLER = "pymc"
+
+# Compiled models keyed by (prior_successes, prior_trials). The model
+# structure only depends on the priors, so every instance with the same
+# prior configuration shares one compiled graph for the lifetime of the
+# process instead of triggering a fresh PyTensor compile.
+_MODEL_CACHE = {}
+
 
 class BayesianABTest:
     """
-    Bayesian A/B Testing using PyMC.
+    Bayesian A/B Testing using a conjugate Beta-Binomial model.
+
+    The posterior for each variant is available in closed form
+    (Beta(prior_successes + successes + 1, prior_failures + failures + 1)),
+    so the default 'exact' method draws posterior samples directly and
+    avoids MCMC entirely. The original PyMC sampler is still available
+    via method='mcmc'.
 
     Example usage:
 
@@ -40,6 +59,12 @@ class BayesianABTest:
         num_samples=2000,
         sequential=False,
         stopping_threshold=0.95,
+        method="exact",
+        nuts_sampler=None,
+        show_plots=False,
+        chains=None,
+        cores=None,
+        progressbar=True,
     ):
         """
         Run Bayesian A/B test experiment and calculate uplift.
@@ -69,8 +94,121 @@ class BayesianABTest:
 
         stopping_threshold : float, default=0.95
             Posterior probability threshold for stopping the sequential test.
+
+        method : str, default='exact'
+            'exact' draws from the closed-form Beta posterior directly,
+            'mcmc' samples the equivalent PyMC model with NUTS.
+
+        nuts_sampler : str, optional
+            NUTS implementation to use for method='mcmc' ('pymc' or
+            'numpyro'). Defaults to 'numpyro' when NumPyro is installed,
+            which JIT-compiles the sampler with JAX and reuses the
+            compiled code on repeat calls, avoiding the per-experiment
+            PyTensor compile overhead.
+
+        show_plots : bool, default=False
+            Whether to render the uplift/posterior plots. Off by default
+            since plot rendering is pure overhead for server and batch
+            callers.
+
+        chains : int, optional
+            Number of MCMC chains for method='mcmc'. Server paths run a
+            single chain to avoid forking the worker process.
+
+        cores : int, optional
+            Number of cores for method='mcmc'.
+
+        progressbar : bool, default=True
+            Whether pm.sample shows its progress bar; disabled on
+            server paths where terminal writes just add contention.
         """
+        if method == "exact":
+            trace = None
+            posterior_a, posterior_b = self._sample_exact_posterior(
+                variant_a_successes,
+                variant_a_trials,
+                variant_b_successes,
+                variant_b_trials,
+                num_samples,
+                sequential,
+                stopping_threshold,
+            )
+        elif method == "mcmc":
+            trace = self._sample_mcmc(
+                variant_a_successes,
+                variant_a_trials,
+                variant_b_successes,
+                variant_b_trials,
+                num_samples,
+                sequential,
+                stopping_threshold,
+                nuts_sampler,
+                chains,
+                cores,
+                progressbar,
+            )
+            # ravel returns a view when the chain/draw layout allows it,
+            # where flatten would always copy the posterior arrays.
+            posterior_a = np.asarray(trace.posterior["prior_a"]).ravel()
+            posterior_b = np.asarray(trace.posterior["prior_b"]).ravel()
+        else:
+            raise ValueError(f"Invalid method: {method}. Use 'exact' or 'mcmc'.")
+
+        # Calculate the uplift based on the chosen method
+        self.uplift_method = uplift_method
+        self.uplift_dist = calculate_uplift(posterior_a, posterior_b, uplift_method)
+
+        # Display the results
+        self.plots = display_results(
+            self.uplift_dist, uplift_method, trace=trace, show_plots=show_plots
+        )
+
+    def _sample_exact_posterior(
+        self,
+        variant_a_successes,
+        variant_a_trials,
+        variant_b_successes,
+        variant_b_trials,
+        num_samples,
+        sequential,
+        stopping_threshold,
+    ):
+        """Draw posterior samples from the closed-form Beta posterior."""
+        alpha_a = self.prior_successes + variant_a_successes + 1
+        beta_a = self.prior_failures + (variant_a_trials - variant_a_successes) + 1
+        alpha_b = self.prior_successes + variant_b_successes + 1
+        beta_b = self.prior_failures + (variant_b_trials - variant_b_successes) + 1
+
+        print(
+            f"Running {'sequential' if sequential else 'non-sequential'} Bayesian A/B test"
+        )
 
+        rng = np.random.default_rng()
+        posterior_a = rng.beta(alpha_a, beta_a, size=num_samples)
+        posterior_b = rng.beta(alpha_b, beta_b, size=num_samples)
+
+        if sequential:
+            # Check the posterior probability on a growing sample, mirroring
+            # the burn-in/thinning schedule of the MCMC sequential test.
+            burn_in = 100
+            thinning = 5
+            for i in range(burn_in, num_samples + 1, thinning):
+                posterior_prob = np.mean(posterior_b[:i] > posterior_a[:i])
+                if posterior_prob > stopping_threshold:
+                    print(
+                        f"Stopping early at sample {i} with posterior probability {posterior_prob:.2f}"
+                    )
+                    return posterior_a[:i], posterior_b[:i]
+
+        return posterior_a, posterior_b
+
+    def _build_model(self):
+        """Build the PyMC model once, with observed data as MutableData.
+
+        The model structure only depends on the priors, so the compiled
+        graph can be reused across experiments by swapping the observed
+        data with pm.set_data instead of rebuilding and recompiling.
+        """
         # Defining the Bayesian model using PyMC
         with pm.Model() as model:
             # Priors for variant A and B (Beta distributions with prior data)
@@ -81,28 +219,80 @@ class BayesianABTest:
                 "prior_b", alpha=self.prior_successes + 1, beta=self.prior_failures + 1
             )
 
+            # Observed data, swappable between experiments
+            a_successes = pm.MutableData("a_successes", 0)
+            a_trials = pm.MutableData("a_trials", 1)
+            b_successes = pm.MutableData("b_successes", 0)
+            b_trials = pm.MutableData("b_trials", 1)
+
             # Likelihoods (Binomial distributions) based on observed data for each variant
-            likelihood_a = pm.Binomial(
+            pm.Binomial(
                 "likelihood_a",
-                n=variant_a_trials,
+                n=a_trials,
                 p=prior_a,
-                observed=variant_a_successes,
+                observed=a_successes,
             )
-            likelihood_b = pm.Binomial(
+            pm.Binomial(
                 "likelihood_b",
-                n=variant_b_trials,
+                n=b_trials,
                 p=prior_b,
-                observed=variant_b_successes,
+                observed=b_successes,
+            )
+
+        return model
+
+    def _sample_mcmc(
+        self,
+        variant_a_successes,
+        variant_a_trials,
+        variant_b_successes,
+        variant_b_trials,
+        num_samples,
+        sequential,
+        stopping_threshold,
+        nuts_sampler,
+        chains=None,
+        cores=None,
+        progressbar=True,
+    ):
+        """Sample the PyMC model with NUTS, reusing the compiled model."""
+        if nuts_sampler is None:
+            nuts_sampler = DEFAULT_NUTS_SAMPLER
+
+        cache_key = (self.prior_successes, self.prior_trials)
+        model = _MODEL_CACHE.get(cache_key)
+        if model is None:
+            model = _MODEL_CACHE[cache_key] = self._build_model()
+
+        with model:
+            pm.set_data(
+                {
+                    "a_successes": variant_a_successes,
+                    "a_trials": variant_a_trials,
+                    "b_successes": variant_b_successes,
+                    "b_trials": variant_b_trials,
+                }
+            )
+
+            print(
+                f"Running {'sequential' if sequential else 'non-sequential'} Bayesian A/B test"
             )
-            
-            print(f"Running {'sequential' if sequential else 'non-sequential'} Bayesian A/B test")
 
             if sequential:
                 # Burn-in and thinning parameters for MCMC
                 burn_in = 100  # Ignore the first 100 samples for model stabilization
                 thinning = 5  # Only keep every 5th sample to reduce autocorrelation
                 for i in range(burn_in, num_samples + 1, thinning):
-                    trace = pm.sample(1, return_inferencedata=True, tune=0, target_accept=0.95)
+                    trace = pm.sample(
+                        1,
+                        return_inferencedata=True,
+                        tune=0,
+                        target_accept=0.95,
+                        nuts_sampler=nuts_sampler,
+                        chains=chains,
+                        cores=cores,
+                        progressbar=progressbar,
+                    )
                     posterior_prob = (
                         (trace.posterior["prior_b"] > trace.posterior["prior_a"])
                         .mean()
@@ -116,15 +306,14 @@ class BayesianABTest:
             else:
                 # Sample from the posterior distribution
                 trace = pm.sample(
-                    num_samples, 
-                    return_inferencedata=True, 
-                    target_accept=0.95, 
-                    tune=1000  # Increase the number of tuning steps
+                    num_samples,
+                    return_inferencedata=True,
+                    target_accept=0.95,
+                    tune=1000,  # Increase the number of tuning steps
+                    nuts_sampler=nuts_sampler,
+                    chains=chains,
+                    cores=cores,
+                    progressbar=progressbar,
                 )
 
-        # Calculate the uplift based on the chosen method
-        self.uplift_method = uplift_method
-        self.uplift_dist = calculate_uplift(trace, uplift_method)
-
-        # Display the results
-        self.plots = display_results(trace, self.uplift_dist, uplift_method)
\ No newline at end of file
+        return trace
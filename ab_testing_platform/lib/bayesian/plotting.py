@@ -1,29 +1,34 @@
 import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import tempfile
+from scipy.stats import gaussian_kde
 
 
 def plot_uplift_distribution(uplift_dist, uplift_method, figsize=(18, 6)):
     """Plot the uplift distribution and cumulative distribution."""
-    sns.set_style("whitegrid")
+    uplift_dist = np.asarray(uplift_dist)
+
+    # Fit one KDE and evaluate it on a fixed grid shared by both
+    # subplots, instead of re-running a fresh KDE fit per seaborn
+    # kdeplot call over the same samples.
+    kde = gaussian_kde(uplift_dist)
+    pad = 3 * kde.factor * uplift_dist.std()
+    grid = np.linspace(uplift_dist.min() - pad, uplift_dist.max() + pad, 1024)
+    density = kde(grid)
+    cumulative = np.cumsum(density)
+    cumulative /= cumulative[-1]
+
     plt.figure(figsize=figsize)
 
     # Uplift distribution
     plt.subplot(1, 2, 1)
     plt.title("Uplift Distribution")
-    ax = sns.kdeplot(uplift_dist, fill=True, color="black")
-
-    if ax.lines:
-        kde_x, kde_y = ax.lines[0].get_data()
-        cutoff = 1 if uplift_method == "ratio" else 0
+    plt.plot(grid, density, color="black")
 
-        plt.axvline(x=cutoff, linestyle="--", color="black")
-        plt.fill_between(
-            kde_x, kde_y, where=(kde_x <= cutoff), color="orange", alpha=0.6
-        )
-        plt.fill_between(
-            kde_x, kde_y, where=(kde_x > cutoff), color="lightgreen", alpha=0.6
-        )
+    cutoff = 1 if uplift_method == "ratio" else 0
+    plt.axvline(x=cutoff, linestyle="--", color="black")
+    plt.fill_between(grid, density, where=(grid <= cutoff), color="orange", alpha=0.6)
+    plt.fill_between(grid, density, where=(grid > cutoff), color="lightgreen", alpha=0.6)
 
     plt.xlabel("Uplift")
     plt.ylabel("Density")
@@ -31,7 +36,8 @@ def plot_uplift_distribution(uplift_dist, uplift_method, figsize=(18, 6)):
     # Cumulative distribution
     plt.subplot(1, 2, 2)
     plt.title("Cumulative Uplift Distribution")
-    sns.kdeplot(uplift_dist, cumulative=True, color="blue", fill=True)
+    plt.plot(grid, cumulative, color="blue")
+    plt.fill_between(grid, cumulative, color="blue", alpha=0.25)
     plt.xlabel("Cumulative Uplift")
     plt.ylabel("Density")
 
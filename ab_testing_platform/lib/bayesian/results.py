@@ -6,35 +6,55 @@ import tempfile
 from .plotting import plot_uplift_distribution
 
 
-def display_results(trace, uplift_dist, uplift_method):
-    """Display the results of the Bayesian A/B test."""
+def display_results(uplift_dist, uplift_method, trace=None, show_plots=False):
+    """Display the results of the Bayesian A/B test.
+
+    Plot generation is opt-in: rendering the matplotlib figures costs
+    hundreds of milliseconds per experiment, so server and batch
+    callers leave show_plots off. When the posterior was drawn in
+    closed form there is no MCMC trace; the ArviZ summary and posterior
+    plot are only produced when a trace is provided.
+    """
     uplift_percent_above_0 = np.mean(uplift_dist >= 0)
+    uplift_mean = np.mean(uplift_dist)
+    uplift_hdi_low, uplift_hdi_high = np.percentile(uplift_dist, [2.5, 97.5])
 
     # Print summary of results
     summary = (
         "\nBayesian A/B Test Summary\n==========================\n"
         f"Evaluation Metric: {uplift_method.capitalize()} Uplift\n"
         f"Uplift above threshold: {uplift_percent_above_0 * 100:.2f}% of simulations\n"
+        f"Mean Uplift: {uplift_mean:.4f} "
+        f"(95% interval: {uplift_hdi_low:.4f} to {uplift_hdi_high:.4f})\n"
     )
     print(summary)
 
-    # Plot the posterior distributions and uplift
-    uplift_image = plot_uplift_distribution(uplift_dist, uplift_method)
-
-    # Use ArviZ to summarize the posterior distributions
-    posterior_summary = az.summary(trace)
-    print("\nPosterior Distributions\n=======================")
-    print(posterior_summary)
-
-    # Plot posterior distributions
-    az.plot_posterior(trace)
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name, format="png")
-    plt.close()
-
-    return {
+    results = {
         "summary": summary,
-        "posterior_summary": posterior_summary,
-        "uplift_image": uplift_image,
-        "posterior_image": temp_file.name,
+        "uplift_summary": {
+            "mean": float(uplift_mean),
+            "2.5%": float(uplift_hdi_low),
+            "97.5%": float(uplift_hdi_high),
+        },
     }
+
+    if show_plots:
+        # Plot the posterior distributions and uplift
+        results["uplift_image"] = plot_uplift_distribution(uplift_dist, uplift_method)
+
+    if trace is not None:
+        # Use ArviZ to summarize the posterior distributions
+        posterior_summary = az.summary(trace)
+        print("\nPosterior Distributions\n=======================")
+        print(posterior_summary)
+        results["posterior_summary"] = posterior_summary
+
+        if show_plots:
+            # Plot posterior distributions
+            az.plot_posterior(trace)
+            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+            plt.savefig(temp_file.name, format="png")
+            plt.close()
+            results["posterior_image"] = temp_file.name
+
+    return results
@@ -1,6 +1,58 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 from ..bayesian import BayesianABTest
 
 
+def _run_one(
+    control_success,
+    control_trials,
+    test_success,
+    test_trials,
+    prior_successes,
+    prior_trials,
+    num_samples,
+    sequential,
+    stopping_threshold,
+    show_plots,
+):
+    """Run a single control-vs-test Bayesian experiment.
+
+    MCMC runs use a single chain on one core with the progress bar off:
+    this path already parallelizes across test groups, and forking
+    extra chain processes from a worker (or an ASGI server) can
+    deadlock.
+
+    Lives at module scope so it can be pickled and dispatched to worker
+    processes.
+    """
+    exp = BayesianABTest(prior_successes, prior_trials)
+    exp.run_experiment(
+        control_success,
+        control_trials,
+        test_success,
+        test_trials,
+        uplift_method="percent",
+        num_samples=num_samples,
+        sequential=sequential,
+        stopping_threshold=stopping_threshold,
+        show_plots=show_plots,
+        chains=1,
+        cores=1,
+        progressbar=False,
+    )
+
+    return {
+        "method": "bayesian",
+        "control_success": control_success,
+        "control_trials": control_trials,
+        "test_success": test_success,
+        "test_trials": test_trials,
+        "uplift_method": exp.uplift_method,
+        "plots": exp.plots,
+    }
+
+
 def run_bayesian_test(
     group_results,
     prior_successes,
@@ -8,10 +60,14 @@ def run_bayesian_test(
     num_samples,
     sequential=False,
     stopping_threshold=None,
+    show_plots=False,
 ):
     """
     Run Bayesian A/B testing.
 
+    The per-group experiments are independent, so with multiple test
+    groups they are dispatched to a process pool and run in parallel.
+
     Parameters
     ----------
     group_results : dict
@@ -32,6 +88,9 @@ def run_bayesian_test(
     stopping_threshold : float, optional
         The threshold for stopping the experiment early if sequential testing is used.
 
+    show_plots : bool, optional
+        Whether to render the uplift/posterior plots for each group.
+
     Returns
     -------
     dict
@@ -40,33 +99,46 @@ def run_bayesian_test(
     control_group = "control"
     test_groups = [group for group in group_results.keys() if group != control_group]
 
+    control_success = group_results[control_group]["success"]
+    control_trials = group_results[control_group]["trials"]
+
     results = {}
-    for test_group in test_groups:
-        control_success = group_results[control_group]["success"]
-        control_trials = group_results[control_group]["trials"]
-        test_success = group_results[test_group]["success"]
-        test_trials = group_results[test_group]["trials"]
-
-        exp = BayesianABTest(prior_successes, prior_trials)
-        exp.run_experiment(
-            control_success,
-            control_trials,
-            test_success,
-            test_trials,
-            uplift_method="percent",
-            num_samples=num_samples,
-            sequential=sequential,
-            stopping_threshold=stopping_threshold,
-        )
-
-        results[test_group] = {
-            "method": "bayesian",
-            "control_success": control_success,
-            "control_trials": control_trials,
-            "test_success": test_success,
-            "test_trials": test_trials,
-            "uplift_method": exp.uplift_method,
-            "plots": exp.plots,
+
+    if len(test_groups) <= 1:
+        for test_group in test_groups:
+            results[test_group] = _run_one(
+                control_success,
+                control_trials,
+                group_results[test_group]["success"],
+                group_results[test_group]["trials"],
+                prior_successes,
+                prior_trials,
+                num_samples,
+                sequential,
+                stopping_threshold,
+                show_plots,
+            )
+        return results
+
+    max_workers = min(len(test_groups), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            test_group: executor.submit(
+                _run_one,
+                control_success,
+                control_trials,
+                group_results[test_group]["success"],
+                group_results[test_group]["trials"],
+                prior_successes,
+                prior_trials,
+                num_samples,
+                sequential,
+                stopping_threshold,
+                show_plots,
+            )
+            for test_group in test_groups
         }
+        for test_group in test_groups:
+            results[test_group] = futures[test_group].result()
 
     return results
@@ -1,3 +1,6 @@
+import numpy as np
+from scipy.special import ndtr
+
 from ..frequentist import FrequentistABTest
 
 
@@ -7,6 +10,10 @@ def run_frequentist_test(
     """
     Run Frequentist A/B testing.
 
+    For non-sequential tests the two-proportion z-test is computed for
+    all test groups in one vectorized pass rather than one scipy call
+    per group.
+
     Parameters
     ----------
     group_results : dict
@@ -29,23 +36,48 @@ def run_frequentist_test(
     control_group = "control"
     test_groups = [group for group in group_results.keys() if group != control_group]
 
+    control_success = group_results[control_group]["success"]
+    control_trials = group_results[control_group]["trials"]
+
     results = {}
-    for test_group in test_groups:
-        control_success = group_results[control_group]["success"]
-        control_trials = group_results[control_group]["trials"]
-        test_success = group_results[test_group]["success"]
-        test_trials = group_results[test_group]["trials"]
 
+    if sequential:
+        for test_group in test_groups:
+            exp = FrequentistABTest(alpha=alpha, alt_hypothesis="two_tailed")
+            results[test_group] = exp.run_experiment(
+                control_success,
+                control_trials,
+                group_results[test_group]["success"],
+                group_results[test_group]["trials"],
+                sequential=sequential,
+                stopping_threshold=stopping_threshold,
+            )
+        return results
+
+    # Vectorized two-proportion z-test across all test groups at once.
+    test_success = np.array(
+        [group_results[group]["success"] for group in test_groups], dtype=np.float64
+    )
+    test_trials = np.array(
+        [group_results[group]["trials"] for group in test_groups], dtype=np.float64
+    )
+
+    pooled_prop = (control_success + test_success) / (control_trials + test_trials)
+    se_pooled = np.sqrt(
+        pooled_prop * (1 - pooled_prop) * (1 / control_trials + 1 / test_trials)
+    )
+    stat = (test_success / test_trials - control_success / control_trials) / se_pooled
+    pvalue = 2 * ndtr(-np.abs(stat))  # two-tailed, as in the per-group path
+
+    for group_id, test_group in enumerate(test_groups):
         exp = FrequentistABTest(alpha=alpha, alt_hypothesis="two_tailed")
-        exp_results = exp.run_experiment(
+        results[test_group] = exp.summarize_experiment(
             control_success,
             control_trials,
-            test_success,
-            test_trials,
-            sequential=sequential,
-            stopping_threshold=stopping_threshold,
+            group_results[test_group]["success"],
+            group_results[test_group]["trials"],
+            float(stat[group_id]),
+            float(pvalue[group_id]),
         )
 
-        results[test_group] = exp_results
-
     return results
@@ -1,6 +1,8 @@
+import numpy as np
+
 from .frequentist_test import run_frequentist_test
 from .bayesian_test import run_bayesian_test
-from .utils import assign_to_group
+from .utils import bucket_users, build_bucket_lookup
 
 
 class UserBucketingABTest:
@@ -45,6 +47,11 @@ class UserBucketingABTest:
 
     stopping_threshold : float, optional
         The threshold for stopping the experiment early if sequential testing is used.
+
+    hash_algorithm : str, optional
+        Hash used for bucketing ('xxhash' or 'sha256'). Defaults to
+        'xxhash' when available; pass 'sha256' to keep bucket
+        assignments stable for users bucketed before the switch.
     """
 
     def __init__(
@@ -56,6 +63,7 @@ class UserBucketingABTest:
         num_samples=2000,
         sequential=False,
         stopping_threshold=None,
+        hash_algorithm=None,
     ):
         self.method = method
         self.alpha = alpha
@@ -64,6 +72,7 @@ class UserBucketingABTest:
         self.num_samples = num_samples
         self.sequential = sequential
         self.stopping_threshold = stopping_threshold
+        self.hash_algorithm = hash_algorithm
 
     def run_experiment(self, user_data, group_buckets):
         """
@@ -71,8 +80,8 @@ class UserBucketingABTest:
 
         Parameters
         ----------
-        user_data : list of dicts
-            A list of dictionaries where each dictionary represents a user and contains the following keys:
+        user_data : iterable of dicts
+            An iterable of dictionaries where each dictionary represents a user and contains the following keys:
             - 'user_id': The unique identifier for the user.
             - 'event': 1 for success (e.g., clicked), 0 for failure (e.g., did not click).
 
@@ -84,16 +93,42 @@ class UserBucketingABTest:
         dict
             A dictionary containing the test results (statistic, p-value, or uplift distribution).
         """
+        bucket_count = 100
+        group_names = list(group_buckets.keys())
+
+        # Precompute the bucket -> group lookup once instead of scanning
+        # group_buckets per user.
+        bucket_to_group = build_bucket_lookup(group_buckets, bucket_count=bucket_count)
+
+        # Hash all user_ids and aggregate trials/successes in bulk rather
+        # than one Python-level dict update per user. A single pass over
+        # user_data means streamed/generated input works too.
+        ids = []
+        events = []
+        for user in user_data:
+            ids.append(user["user_id"])
+            events.append(user["event"])
+        events = np.asarray(events, dtype=np.float64)
+        buckets = bucket_users(
+            ids, bucket_count=bucket_count, hash_algorithm=self.hash_algorithm
+        )
+
+        group_ids = bucket_to_group[buckets]
+        if np.any(group_ids < 0):
+            raise ValueError("User not assigned to a valid group.")
+
+        successes = np.bincount(group_ids, weights=events, minlength=len(group_names))
+        trials = np.bincount(group_ids, minlength=len(group_names))
+
         group_results = {
-            group: {"success": 0, "trials": 0} for group in group_buckets.keys()
+            group: {"success": success, "trials": trial_count}
+            for group, success, trial_count in zip(
+                group_names,
+                successes.astype(np.int64).tolist(),
+                trials.tolist(),
+            )
         }
 
-        # Assign users to groups and record their results
-        for user in user_data:
-            group = assign_to_group(user["user_id"], group_buckets)
-            group_results[group]["trials"] += 1
-            group_results[group]["success"] += user["event"]
-
         if self.method == "frequentist":
             return run_frequentist_test(
                 group_results, self.alpha, self.sequential, self.stopping_threshold
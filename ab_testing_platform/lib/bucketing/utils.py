@@ -1,7 +1,21 @@
 import hashlib
 
+import numpy as np
 
-def bucket_user(user_id, bucket_count=100):
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# xxhash is 5-10x faster than SHA-256 and the hash has no security role
+# here, so prefer it when installed; 'blake2b' is the fastest stdlib-only
+# choice. Note that each algorithm produces different bucket assignments;
+# deployments that need stable assignments for existing users should pass
+# hash_algorithm='sha256' explicitly.
+DEFAULT_HASH_ALGORITHM = "xxhash" if xxhash is not None else "blake2b"
+
+
+def bucket_user(user_id, bucket_count=100, hash_algorithm=None):
     """
     Assign a user to a bucket based on a hashed value of their user_id.
 
@@ -13,16 +27,117 @@ def bucket_user(user_id, bucket_count=100):
     bucket_count : int, default=100
         The total number of buckets (this determines the granularity of bucketing).
 
+    hash_algorithm : str, optional
+        'xxhash', 'blake2b' or 'sha256'. Defaults to 'xxhash' when available.
+
     Returns
     -------
     int
         A bucket number between 0 and bucket_count-1.
     """
-    hashed_value = int(hashlib.sha256(str(user_id).encode("utf-8")).hexdigest(), 16)
-    return hashed_value % bucket_count
+    if hash_algorithm is None:
+        hash_algorithm = DEFAULT_HASH_ALGORITHM
+
+    if hash_algorithm == "xxhash":
+        return xxhash.xxh3_64_intdigest(str(user_id)) % bucket_count
+    if hash_algorithm == "blake2b":
+        digest = hashlib.blake2b(str(user_id).encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % bucket_count
+    if hash_algorithm == "sha256":
+        digest = hashlib.sha256(
+            str(user_id).encode("utf-8"), usedforsecurity=False
+        ).digest()
+        return int.from_bytes(digest, "big") % bucket_count
+    raise ValueError(
+        f"Invalid hash algorithm: {hash_algorithm}. Use 'xxhash', 'blake2b' or 'sha256'."
+    )
+
+
+def bucket_users(user_ids, bucket_count=100, hash_algorithm=None):
+    """
+    Assign a sequence of users to buckets in one pass.
+
+    Parameters
+    ----------
+    user_ids : sequence of str or int
+        The unique identifiers for the users.
+
+    bucket_count : int, default=100
+        The total number of buckets.
+
+    hash_algorithm : str, optional
+        'xxhash', 'blake2b' or 'sha256'. Defaults to 'xxhash' when available.
+
+    Returns
+    -------
+    np.ndarray
+        An array of bucket numbers between 0 and bucket_count-1.
+    """
+    if hash_algorithm is None:
+        hash_algorithm = DEFAULT_HASH_ALGORITHM
+
+    if hash_algorithm == "xxhash":
+        def hash_id(user_id):
+            return xxhash.xxh3_64_intdigest(str(user_id))
+
+    elif hash_algorithm == "blake2b":
+        def hash_id(user_id):
+            return int.from_bytes(
+                hashlib.blake2b(str(user_id).encode("utf-8"), digest_size=8).digest(),
+                "big",
+            )
+
+    elif hash_algorithm == "sha256":
+        def hash_id(user_id):
+            return int.from_bytes(
+                hashlib.sha256(
+                    str(user_id).encode("utf-8"), usedforsecurity=False
+                ).digest(),
+                "big",
+            )
+
+    else:
+        raise ValueError(
+            f"Invalid hash algorithm: {hash_algorithm}. Use 'xxhash', 'blake2b' or 'sha256'."
+        )
+
+    # Users commonly appear once per event, so hash each distinct
+    # user_id once and serve repeats from the cache.
+    cache = {}
+    buckets = np.empty(len(user_ids), dtype=np.intp)
+    for i, user_id in enumerate(user_ids):
+        bucket = cache.get(user_id)
+        if bucket is None:
+            bucket = cache[user_id] = hash_id(user_id) % bucket_count
+        buckets[i] = bucket
+    return buckets
+
+
+def build_bucket_lookup(group_buckets, bucket_count=100):
+    """
+    Precompute a bucket -> group id lookup table.
+
+    Parameters
+    ----------
+    group_buckets : dict
+        A dictionary where keys are group names and values are ranges of buckets assigned to each group.
+
+    bucket_count : int, default=100
+        The total number of buckets.
+
+    Returns
+    -------
+    np.ndarray
+        An array of length bucket_count mapping each bucket to the index
+        of its group in group_buckets order, with -1 for unassigned buckets.
+    """
+    bucket_lookup = np.full(bucket_count, -1, dtype=np.intp)
+    for group_id, bucket_range in enumerate(group_buckets.values()):
+        bucket_lookup[list(bucket_range)] = group_id
+    return bucket_lookup
 
 
-def assign_to_group(user_id, group_buckets):
+def assign_to_group(user_id, group_buckets, hash_algorithm=None, bucket_lookup=None):
     """
     Assign a user to a group based on their bucket.
 
@@ -34,13 +149,23 @@ def assign_to_group(user_id, group_buckets):
     group_buckets : dict
         A dictionary where keys are group names and values are ranges of buckets assigned to each group.
 
+    hash_algorithm : str, optional
+        'xxhash', 'blake2b' or 'sha256'. Defaults to 'xxhash' when available.
+
+    bucket_lookup : np.ndarray, optional
+        Precomputed table from build_bucket_lookup. Callers assigning
+        many users should build it once and pass it in so each lookup
+        is O(1) instead of scanning group_buckets.
+
     Returns
     -------
     str
         The group name based on the user's bucket assignment.
     """
-    user_bucket = bucket_user(user_id)
-    for group, bucket_range in group_buckets.items():
-        if user_bucket in bucket_range:
-            return group
-    raise ValueError("User not assigned to a valid group.")
+    if bucket_lookup is None:
+        bucket_lookup = build_bucket_lookup(group_buckets)
+
+    group_id = bucket_lookup[bucket_user(user_id, hash_algorithm=hash_algorithm)]
+    if group_id < 0:
+        raise ValueError("User not assigned to a valid group.")
+    return list(group_buckets)[group_id]
@@ -1,6 +1,21 @@
 import numpy as np
 
 
+def benjamini_hochberg_on_sorted(p_sorted):
+    """Benjamini-Hochberg correction for p-values already sorted ascending."""
+    n = p_sorted.size
+    # Step-up: scale by n/rank, then enforce monotonicity with a running
+    # minimum from the largest p-value downwards. The scale, the
+    # accumulate and the clip all reuse one buffer, so the whole
+    # correction allocates two N-float arrays instead of five.
+    adjusted = p_sorted * n
+    adjusted /= np.arange(1, n + 1)
+    reversed_view = adjusted[::-1]
+    np.minimum.accumulate(reversed_view, out=reversed_view)
+    np.minimum(adjusted, 1.0, out=adjusted)
+    return adjusted
+
+
 def benjamini_hochberg_correction(p_values):
     """
     Apply Benjamini-Hochberg (FDR) correction to p-values.
@@ -13,10 +28,14 @@ def benjamini_hochberg_correction(p_values):
     Returns
     -------
     corrected_pvalues : np.array
-        FDR-corrected p-values using the Benjamini-Hochberg method.
+        FDR-corrected p-values using the Benjamini-Hochberg method, in
+        the original order.
     """
-    sorted_p = np.argsort(p_values)
-    ranked_pvalues = np.empty_like(p_values)
-    ranked_pvalues[sorted_p] = np.arange(1, len(p_values) + 1)
-    corrected_pvalues = p_values * len(p_values) / ranked_pvalues
-    return np.minimum.accumulate(np.minimum(corrected_pvalues, 1.0))
+    p_values = np.asarray(p_values)
+    order = np.argsort(p_values)
+    adjusted = benjamini_hochberg_on_sorted(p_values[order])
+
+    # Scatter back to the original order via the inverse permutation.
+    inverse = np.empty(order.size, dtype=np.intp)
+    inverse[order] = np.arange(order.size)
+    return adjusted[inverse]
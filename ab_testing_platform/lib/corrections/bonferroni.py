@@ -15,5 +15,8 @@ def bonferroni_correction(p_values):
     corrected_pvalues : np.array
         Bonferroni-corrected p-values.
     """
-    corrected_pvalues = np.minimum(p_values * len(p_values), 1.0)
+    p_values = np.asarray(p_values, dtype=np.float64)
+    # Scale and clip in one buffer rather than allocating twice.
+    corrected_pvalues = np.multiply(p_values, p_values.size)
+    np.minimum(corrected_pvalues, 1.0, out=corrected_pvalues)
     return corrected_pvalues
@@ -1,6 +1,14 @@
 import numpy as np
 
 
+def holm_on_sorted(p_sorted):
+    """Holm correction for p-values already sorted ascending."""
+    n = p_sorted.size
+    # Step-down: multiply the i-th smallest p-value by (n - i) and
+    # enforce monotonicity with a running maximum over the sorted order.
+    return np.minimum(np.maximum.accumulate(p_sorted * np.arange(n, 0, -1)), 1.0)
+
+
 def holm_correction(p_values):
     """
     Apply Holm correction to p-values.
@@ -13,10 +21,13 @@ def holm_correction(p_values):
     Returns
     -------
     corrected_pvalues : np.array
-        Holm-corrected p-values.
+        Holm-corrected p-values, in the original order.
     """
-    sorted_p = np.argsort(p_values)
-    ranked_pvalues = np.empty_like(p_values)
-    ranked_pvalues[sorted_p] = np.arange(len(p_values), 0, -1)
-    corrected_pvalues = p_values * ranked_pvalues
-    return np.minimum.accumulate(np.minimum(corrected_pvalues, 1.0))
+    p_values = np.asarray(p_values)
+    order = np.argsort(p_values)
+    adjusted = holm_on_sorted(p_values[order])
+
+    # Scatter back to the original order via the inverse permutation.
+    inverse = np.empty(order.size, dtype=np.intp)
+    inverse[order] = np.arange(order.size)
+    return adjusted[inverse]
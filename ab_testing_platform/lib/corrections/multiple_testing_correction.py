@@ -2,8 +2,8 @@ import numpy as np
 import pandas as pd
 
 from .bonferroni import bonferroni_correction
-from .benjamini_hochberg import benjamini_hochberg_correction
-from .holm import holm_correction
+from .benjamini_hochberg import benjamini_hochberg_on_sorted
+from .holm import holm_on_sorted
 from .statsmodels import statsmodels_corrections
 
 
@@ -52,7 +52,7 @@ class MultipleTestingCorrection:
     print(correction.summary(method='fdr_bh'))
     """
 
-    def __init__(self, p_values):
+    def __init__(self, p_values, copy=True):
         """
         Initialize the correction class with a list of p-values.
 
@@ -60,8 +60,42 @@ class MultipleTestingCorrection:
         ----------
         p_values : list or np.array
             List or array of p-values from multiple tests.
+        copy : bool, default=True
+            Copy the input array. Callers that own their array and do
+            not need it afterwards can pass copy=False to skip the
+            extra N-float allocation.
         """
-        self.p_values = np.array(p_values)
+        self.p_values = np.asarray(p_values, dtype=np.float64)
+        if copy:
+            self.p_values = self.p_values.copy()
+
+        self._order_cache = None
+        self._p_sorted_cache = None
+        self._inverse_cache = None
+
+    # Every correction except Bonferroni needs the p-values in
+    # ascending order; the sort and its permutations are computed on
+    # first use and shared across methods, so Bonferroni-only callers
+    # never pay for an argsort.
+
+    @property
+    def _order(self):
+        if self._order_cache is None:
+            self._order_cache = np.argsort(self.p_values)
+        return self._order_cache
+
+    @property
+    def _p_sorted(self):
+        if self._p_sorted_cache is None:
+            self._p_sorted_cache = self.p_values[self._order]
+        return self._p_sorted_cache
+
+    @property
+    def _inverse(self):
+        if self._inverse_cache is None:
+            self._inverse_cache = np.empty_like(self._order)
+            self._inverse_cache[self._order] = np.arange(self._order.size)
+        return self._inverse_cache
 
     def bonferroni_correction(self):
         """
@@ -83,7 +117,7 @@ class MultipleTestingCorrection:
         corrected_pvalues : np.array
             FDR-corrected p-values using the Benjamini-Hochberg method.
         """
-        return benjamini_hochberg_correction(self.p_values)
+        return benjamini_hochberg_on_sorted(self._p_sorted)[self._inverse]
 
     def holm_correction(self):
         """
@@ -94,7 +128,49 @@ class MultipleTestingCorrection:
         corrected_pvalues : np.array
             Holm-corrected p-values.
         """
-        return holm_correction(self.p_values)
+        return holm_on_sorted(self._p_sorted)[self._inverse]
+
+    def holm_reject(self, alpha=0.05):
+        """
+        Holm reject/accept decisions at level alpha without a full sort.
+
+        Every Holm rejection has a raw p-value at most alpha, so only
+        the k smallest p-values with p <= alpha can matter. Those are
+        pulled out with np.argpartition and sorted on their own, which
+        is O(N + k log k) instead of the O(N log N) full correction.
+
+        Parameters
+        ----------
+        alpha : float, default=0.05
+            Family-wise error rate to control.
+
+        Returns
+        -------
+        reject : np.array
+            Boolean mask, True where the hypothesis is rejected, in the
+            original order of the p-values.
+        """
+        p_values = self.p_values
+        n = p_values.size
+        reject = np.zeros(n, dtype=bool)
+
+        k_max = int(np.count_nonzero(p_values <= alpha))
+        if k_max == 0:
+            return reject
+
+        if k_max < n:
+            candidates = np.argpartition(p_values, k_max - 1)[:k_max]
+        else:
+            candidates = np.arange(n)
+        candidates = candidates[np.argsort(p_values[candidates])]
+
+        # Step down until the first p-value exceeds its Holm threshold.
+        thresholds = alpha / (n - np.arange(k_max))
+        failed = p_values[candidates] > thresholds
+        cutoff = int(np.argmax(failed)) if failed.any() else k_max
+
+        reject[candidates[:cutoff]] = True
+        return reject
 
     def apply_statsmodels_corrections(self, method="fdr_bh"):
         """
@@ -113,7 +189,8 @@ class MultipleTestingCorrection:
         corrected_pvalues : np.array
             Corrected p-values based on the chosen method.
         """
-        return statsmodels_corrections(self.p_values, method)
+        corrected = statsmodels_corrections(self._p_sorted, method, is_sorted=True)
+        return corrected[self._inverse]
 
     def summary(self, method="fdr_bh"):
         """
@@ -1,7 +1,7 @@
 from statsmodels.stats.multitest import multipletests
 
 
-def statsmodels_corrections(p_values, method="fdr_bh"):
+def statsmodels_corrections(p_values, method="fdr_bh", is_sorted=False):
     """
     Use statsmodels to apply various p-value correction methods.
 
@@ -16,10 +16,16 @@ def statsmodels_corrections(p_values, method="fdr_bh"):
         - 'fdr_bh' (Benjamini-Hochberg)
         - 'holm'
 
+    is_sorted : bool, default=False
+        Whether p_values is already sorted ascending; passing True lets
+        statsmodels skip its internal sort.
+
     Returns
     -------
     corrected_pvalues : np.array
         Corrected p-values based on the chosen method.
     """
-    _, corrected_pvalues, _, _ = multipletests(p_values, method=method)
+    _, corrected_pvalues, _, _ = multipletests(
+        p_values, method=method, is_sorted=is_sorted
+    )
     return corrected_pvalues
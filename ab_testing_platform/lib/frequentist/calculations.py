@@ -1,29 +1,90 @@
+from enum import IntEnum
+
 import numpy as np
-import scipy.stats as st
+from scipy.special import ndtr, ndtri
+
+
+class Tail(IntEnum):
+    """Hypothesis tail tag, resolved from alt_hypothesis once at construction."""
+
+    ONE = 0
+    TWO = 1
+
 
+def calculate_pvalue(stat, tail):
+    """Calculate the p-value based on the test statistic and the tail tag.
 
-def calculate_pvalue(stat, alt_hypothesis, alpha):
-    """Calculate the p-value based on the test statistic and the hypothesis type."""
-    if alt_hypothesis == "one_tailed":
-        return 1 - st.norm.cdf(np.abs(stat)) if stat > 0 else st.norm.cdf(stat)
-    elif alt_hypothesis == "two_tailed":
-        return 2 * (1 - st.norm.cdf(np.abs(stat)))
+    ndtr is used instead of st.norm.cdf/sf: it is the same Cephes
+    routine without the rv_continuous dispatch overhead, and evaluating
+    the tail as ndtr(-|stat|) avoids the 1 - cdf cancellation. Both
+    tails reduce to the same observed-tail probability (the one-tailed
+    sign branch is equivalent to ndtr(-|stat|)), so the tail tag only
+    sets the doubling factor and the whole thing is branch-free
+    arithmetic that broadcasts over stat arrays.
+    """
+    return (1 + tail) * ndtr(-np.abs(stat))
 
 
 def calculate_power(
-    prop_null, trials_null, trials_alt, effect_size, alpha, alt_hypothesis
+    prop_null, trials_null, trials_alt, effect_size, alpha, alt_hypothesis,
+    se_pooled=None,
 ):
-    """Calculate the power of the test given a specific effect size."""
-    se_pooled = np.sqrt(
-        prop_null * (1 - prop_null) * (1 / trials_null + 1 / trials_alt)
-    )
+    """Calculate the power of the test for an effect size.
+
+    effect_size may be a scalar or an ndarray; an array input yields the
+    full power curve in a single vectorized evaluation. se_pooled may be
+    passed in when the caller has already computed it.
+    """
+    if se_pooled is None:
+        se_pooled = np.sqrt(
+            prop_null * (1 - prop_null) * (1 / trials_null + 1 / trials_alt)
+        )
     z_alpha = (
-        st.norm.ppf(1 - alpha / 2)
+        ndtri(1 - alpha / 2)
         if alt_hypothesis == "two_tailed"
-        else st.norm.ppf(1 - alpha)
+        else ndtri(1 - alpha)
     )
     z_effect = effect_size / se_pooled
-    return 1 - st.norm.cdf(z_alpha - z_effect)
+    return ndtr(z_effect - z_alpha)
+
+def sequential_scan(
+    success_null, trials_null, success_alt, trials_alt, tail,
+    stopping_threshold,
+):
+    """Scan every interim look of a sequential test in one pass.
+
+    Computes the running statistic and p-value for each look with
+    vectorized NumPy rather than a Python loop, and returns
+    (stop_index, stat, pvalue) where stop_index is the zero-based look
+    at which the threshold was first crossed, or -1 if it never was (in
+    which case stat and pvalue come from the final look).
+    """
+    total_trials = trials_null + trials_alt
+    i = np.arange(1, total_trials + 1, dtype=np.float64)
+
+    success_null_i = np.floor(i * (success_null / total_trials))
+    success_alt_i = np.floor(i * (success_alt / total_trials))
+
+    prop_null_i = success_null_i / i
+    prop_alt_i = success_alt_i / i
+
+    pooled_prop_i = (success_null_i + success_alt_i) / (2 * i)
+    se_pooled_i = np.sqrt(pooled_prop_i * (1 - pooled_prop_i) * (2 / i))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stat_i = np.where(
+            se_pooled_i > 0, (prop_alt_i - prop_null_i) / se_pooled_i, np.nan
+        )
+
+    pvalue_i = calculate_pvalue(stat_i, tail)
+
+    # NaN p-values compare False here, matching the scalar loop.
+    stopped = pvalue_i < stopping_threshold
+    stop_index = int(np.argmax(stopped))
+    if stopped[stop_index]:
+        return stop_index, float(stat_i[stop_index]), float(pvalue_i[stop_index])
+    return -1, float(stat_i[-1]), float(pvalue_i[-1])
+
 
 def calculate_stat_pvalue(self, sequential, stopping_threshold):
     pooled_prop, se_pooled = calculate_pooled_prop_se(self)
@@ -32,12 +93,10 @@ def calculate_stat_pvalue(self, sequential, stopping_threshold):
     if sequential:
         return self.perform_sequential_testing(stopping_threshold)
     else:
-        pvalue = calculate_pvalue(stat, self.alt_hypothesis, self.alpha)
+        pvalue = self._pvalue_fn(stat)
         return stat, pvalue
 
 def calculate_pooled_prop_se(self):
     pooled_prop = (self.success_null + self.success_alt) / (self.trials_null + self.trials_alt)
-    se_pooled = np.sqrt(
-        pooled_prop * (1 - pooled_prop) * (1 / self.trials_null + 1 / self.trials_alt)
-    )
+    se_pooled = np.sqrt(pooled_prop * (1 - pooled_prop) * self._inv_trials_sum)
     return pooled_prop, se_pooled
@@ -1,7 +1,9 @@
+from functools import partial
+
 import numpy as np
 
 from .validation import validate_hypothesis
-from .calculations import calculate_pvalue, calculate_stat_pvalue
+from .calculations import Tail, calculate_pvalue, calculate_stat_pvalue, sequential_scan
 from .results import display_results
 
 
@@ -32,6 +34,13 @@ class FrequentistABTest:
         self.alt_hypothesis = alt_hypothesis.lower()
         validate_hypothesis(self.alt_hypothesis, self.alpha)
 
+        # Resolve the tail dispatch once here so each p-value is pure
+        # arithmetic with no per-call string comparison.
+        self._tail = (
+            Tail.TWO if self.alt_hypothesis == "two_tailed" else Tail.ONE
+        )
+        self._pvalue_fn = partial(calculate_pvalue, tail=int(self._tail))
+
     def run_experiment(
         self,
         success_null,
@@ -73,32 +82,69 @@ class FrequentistABTest:
 
         self.prop_null = success_null / trials_null
         self.prop_alt = success_alt / trials_alt
+        self._cache_shared_terms()
 
         self.stat, self.pvalue = calculate_stat_pvalue(self, sequential, stopping_threshold)
 
         return display_results(self)
 
+    def summarize_experiment(
+        self, success_null, trials_null, success_alt, trials_alt, stat, pvalue
+    ):
+        """
+        Build the results dict for a test whose statistic and p-value were
+        computed externally, e.g. vectorized across many test groups.
+
+        Parameters
+        ----------
+        success_null : int
+            Successful trials (Version A).
+        trials_null : int
+            Total trials for Version A.
+        success_alt : int
+            Successful trials (Version B).
+        trials_alt : int
+            Total trials for Version B.
+        stat : float
+            Precomputed Z statistic.
+        pvalue : float
+            Precomputed p-value.
+        """
+        self.success_null = success_null
+        self.trials_null = trials_null
+        self.success_alt = success_alt
+        self.trials_alt = trials_alt
+
+        self.prop_null = success_null / trials_null
+        self.prop_alt = success_alt / trials_alt
+        self._cache_shared_terms()
+
+        self.stat = stat
+        self.pvalue = pvalue
+
+        return display_results(self)
+
+    def _cache_shared_terms(self):
+        """Cache subexpressions shared by the z-test and the power curve."""
+        self._inv_trials_sum = 1.0 / self.trials_null + 1.0 / self.trials_alt
+        self._se_null = np.sqrt(
+            self.prop_null * (1 - self.prop_null) * self._inv_trials_sum
+        )
+
     def perform_sequential_testing(self, stopping_threshold):
-        for i in range(1, self.trials_null + self.trials_alt + 1):
-            success_null_i = int(i * (self.success_null / (self.trials_null + self.trials_alt)))
-            success_alt_i = int(i * (self.success_alt / (self.trials_null + self.trials_alt)))
-
-            prop_null_i = success_null_i / i
-            prop_alt_i = success_alt_i / i
-
-            pooled_prop_i = (success_null_i + success_alt_i) / (2 * i)
-            se_pooled_i = np.sqrt(pooled_prop_i * (1 - pooled_prop_i) * (2 / i))
-
-            if se_pooled_i == 0:
-                stat_i = np.nan
-            else:
-                stat_i = (prop_alt_i - prop_null_i) / se_pooled_i
-            pvalue_i = calculate_pvalue(stat_i, self.alt_hypothesis, self.alpha)
-            self.pvalue = pvalue_i
-            self.stat = stat_i
-
-            if pvalue_i < stopping_threshold:
-                print(f"Stopping early at trial {i} with p-value {pvalue_i:.4f}")
-                return stat_i, pvalue_i
+        # The scan itself lives in calculations.sequential_scan; this
+        # method only records the outcome on the instance.
+        stop_index, self.stat, self.pvalue = sequential_scan(
+            self.success_null,
+            self.trials_null,
+            self.success_alt,
+            self.trials_alt,
+            self._tail,
+            stopping_threshold,
+        )
+        if stop_index >= 0:
+            print(
+                f"Stopping early at trial {stop_index + 1} with p-value {self.pvalue:.4f}"
+            )
 
         return self.stat, self.pvalue
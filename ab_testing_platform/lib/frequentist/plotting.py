@@ -1,25 +1,33 @@
-import matplotlib.pyplot as plt
 import tempfile
 
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
 
 def plot_power_curve(effect_sizes, powers, observed_effect_size):
-    """Plot the power curve for the given effect sizes and powers and save it to a temp file."""
-    plt.figure(figsize=(10, 6))
-    plt.plot(effect_sizes, powers, label="Power Curve")
-    plt.axhline(y=0.8, color="red", linestyle="--", label="80% Power Threshold")
-    plt.axvline(
+    """Plot the power curve for the given effect sizes and powers and save it to a temp file.
+
+    The figure is built with the object-oriented Agg API rather than
+    pyplot, so no interactive backend or global figure state is touched
+    in headless pipeline runs.
+    """
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.plot(effect_sizes, powers, label="Power Curve")
+    ax.axhline(y=0.8, color="red", linestyle="--", label="80% Power Threshold")
+    ax.axvline(
         x=observed_effect_size,
         color="blue",
         linestyle="--",
         label="Observed Effect Size",
     )
-    plt.title("Power Curve for A/B Test")
-    plt.xlabel("Effect Size (Difference in Proportions)")
-    plt.ylabel("Power")
-    plt.legend()
+    ax.set_title("Power Curve for A/B Test")
+    ax.set_xlabel("Effect Size (Difference in Proportions)")
+    ax.set_ylabel("Power")
+    ax.legend()
 
     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    plt.savefig(temp_file.name)
+    FigureCanvasAgg(fig).print_png(temp_file.name)
     temp_file.close()
 
     return {"power_curve": temp_file.name}
@@ -7,18 +7,18 @@ def display_results(self):
     """Returns the results of the A/B test."""
 
     effect_sizes = np.arange(0, 0.2, 0.005)
-    powers = [
-        calculate_power(
-            self.prop_null,
-            self.trials_null,
-            self.trials_alt,
-            es,
-            self.alpha,
-            self.alt_hypothesis,
-        )
-        for es in effect_sizes
-    ]
-    plots =  plot_power_curve(effect_sizes, powers, self.prop_alt - self.prop_null)
+    # calculate_power broadcasts over the effect sizes, so the whole
+    # curve is two scipy calls instead of one pair per point.
+    powers = calculate_power(
+        self.prop_null,
+        self.trials_null,
+        self.trials_alt,
+        effect_sizes,
+        self.alpha,
+        self.alt_hypothesis,
+        se_pooled=self._se_null,
+    )
+    plots = plot_power_curve(effect_sizes, powers, self.prop_alt - self.prop_null)
 
     results = {
         "version_a": {
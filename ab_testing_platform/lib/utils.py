@@ -1,5 +1,10 @@
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def validate_input_data(numerator, denominator):
     """
@@ -93,6 +98,9 @@ def load_user_data(file_path: str):
     list
         A list of user data dictionaries.
     """
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
     with open(file_path, "r") as f:
         user_data = json.load(f)
     return user_data
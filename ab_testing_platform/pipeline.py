@@ -1,3 +1,5 @@
+import numpy as np
+
 from .lib.bucketing import UserBucketingABTest
 from .lib.corrections import MultipleTestingCorrection
 
@@ -32,18 +34,25 @@ def run_experiment(
     results = {"method": method, "results": result}
 
     if method == "frequentist":
-        p_values = []
-        for test_group, res in result.items():
-            p_values.append(res["pvalue"])
+        # Gather all groups' p-values into one array up front so the
+        # correction runs once over the whole batch.
+        test_groups = list(result)
+        p_values = np.fromiter(
+            (result[test_group]["pvalue"] for test_group in test_groups),
+            dtype=np.float64,
+            count=len(test_groups),
+        )
 
         # Apply multiple testing correction if there are multiple p-values
-        if len(p_values) > 1:
+        if p_values.size > 1:
             correction_method = "fdr_bh"  # Default correction method
-            correction = MultipleTestingCorrection(p_values)
+            correction = MultipleTestingCorrection(p_values, copy=False)
             corrected_p_values = correction.apply_statsmodels_corrections(
                 method=correction_method
             )
             results["correction_method"] = correction_method
-            results["corrected_p_values"] = dict(zip(result.keys(), corrected_p_values))
+            results["corrected_p_values"] = dict(
+                zip(test_groups, corrected_p_values.tolist())
+            )
 
     return results